@@ -7,7 +7,7 @@ from fastapi import APIRouter, Depends, HTTPException, Header, status
 
 from app.core.logger import logger
 from app.dependencies.product import get_product_service
-from app.dependencies.auth import get_current_user, require_admin
+from app.dependencies.auth import decode_jwt, get_current_user, require_admin
 from app.models.user import User
 from app.schemas.product import ProductStatsResponse
 from app.services.product import ProductService
@@ -40,7 +40,6 @@ async def get_stats(
         raise HTTPException(status_code=401, detail="Authentication required")
     
     try:
-        from app.dependencies.auth import decode_jwt
         token = authorization.replace("Bearer ", "")
         payload = await decode_jwt(token)
         
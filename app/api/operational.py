@@ -16,7 +16,7 @@ from fastapi.responses import JSONResponse
 
 from app.core.config import config
 from app.core.logger import logger
-from app.db.mongodb import db
+from app.db.mongodb import connect_to_mongo, db
 
 router = APIRouter()
 
@@ -189,7 +189,6 @@ async def check_database_health() -> Dict[str, Any]:
     try:
         if not db.client:
             # Try to establish connection if not already connected
-            from app.db.mongodb import connect_to_mongo
             await connect_to_mongo()
         
         # Use ping command which works without listing collections
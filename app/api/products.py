@@ -5,7 +5,7 @@ Clean API layer with dependency injection
 
 from typing import List
 
-from fastapi import APIRouter, Depends, Query, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 
 from app.dependencies.product import get_product_service
 from app.dependencies.auth import get_current_user
@@ -249,7 +249,6 @@ async def reactivate_product(
     """
     # Check if user is admin
     if not user.is_admin():
-        from fastapi import HTTPException
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only administrators can reactivate products"
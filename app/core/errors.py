@@ -3,6 +3,9 @@ Error handling utilities following FastAPI best practices
 """
 
 import traceback
+from typing import Any
+
+import orjson
 from fastapi import HTTPException, Request
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
@@ -21,6 +24,13 @@ class ErrorResponse(Exception):
         super().__init__(message)
 
 
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson for cheaper error serialization"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
 class ErrorResponseModel(BaseModel):
     """Pydantic model for error responses"""
     error: str
@@ -46,7 +56,7 @@ async def error_response_handler(request: Request, exc: ErrorResponse):
         metadata=metadata
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={"error": exc.message, "details": exc.details}
     )
@@ -70,7 +80,7 @@ async def http_exception_handler(request: Request, exc: HTTPException):
         metadata=metadata
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code, 
         content={"error": exc.detail}
     )
\ No newline at end of file
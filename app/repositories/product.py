@@ -2,7 +2,7 @@
 Product repository for data access layer following Repository pattern
 """
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import List, Optional, Dict, Any
 from bson import ObjectId
 
@@ -11,6 +11,7 @@ from motor.motor_asyncio import AsyncIOMotorCollection
 
 from app.core.errors import ErrorResponse
 from app.core.logger import logger
+from app.models.product import ReviewAggregates
 from app.schemas.product import ProductCreate, ProductUpdate, ProductResponse
 
 
@@ -41,7 +42,6 @@ class ProductRepository:
         
         # Ensure review_aggregates is not None - create default if missing
         if doc.get("review_aggregates") is None:
-            from app.models.product import ReviewAggregates
             doc["review_aggregates"] = ReviewAggregates().model_dump()
         
         return ProductResponse(**doc)
@@ -391,8 +391,6 @@ class ProductRepository:
         - Minimum 3 reviews required (with fallbacks)
         """
         try:
-            from datetime import datetime, timedelta, timezone
-            
             thirty_days_ago = datetime.now(timezone.utc) - timedelta(days=30)
             
             # Fetch candidate products (3x limit for filtering)
@@ -11,10 +11,14 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
 
 from app.core.config import config
-from app.core.errors import error_response_handler, http_exception_handler, ErrorResponse
+from app.core.errors import (
+    error_response_handler,
+    http_exception_handler,
+    ErrorResponse,
+    ORJSONResponse,
+)
 from app.core.logger import logger
 from app.db.mongodb import connect_to_mongo, close_mongo_connection
 from app.api import products, operational, admin, home, events
@@ -58,7 +62,7 @@ app = FastAPI(
 
 # Configure error handlers
 app.add_exception_handler(ErrorResponse, error_response_handler)
-app.add_exception_handler(RequestValidationError, lambda request, exc: JSONResponse(
+app.add_exception_handler(RequestValidationError, lambda request, exc: ORJSONResponse(
     status_code=422,
     content={"error": "Validation error", "details": exc.errors()}
 ))
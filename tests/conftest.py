@@ -1,24 +1,21 @@
 """Shared test fixtures for unit, integration, and e2e tests"""
 import pytest
-import asyncio
-from unittest.mock import AsyncMock, Mock
+import pytest_asyncio
+from unittest.mock import AsyncMock
 from datetime import datetime, UTC
 from bson import ObjectId
-from motor.motor_asyncio import AsyncIOMotorClient
-from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
 
 from main import app
 from app.models.product import Product
-from app.schemas.product import ProductCreate
+from app.repositories.product import ProductRepository
+from app.schemas.product import ProductCreate, ProductUpdate
+from app.services.product import ProductService
+from tests.constants import PRODUCT_ID
 
 
-# Pytest configuration
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+# Fixed timestamp so product documents are deterministic and cheap to build
+FROZEN_NOW = datetime(2024, 1, 1, tzinfo=UTC)
 
 
 # Database fixtures
@@ -43,6 +40,25 @@ async def test_db():
     yield None
 
 
+# Service fixtures
+@pytest.fixture
+def mock_repository():
+    """Mock ProductRepository restricted to the real repository interface"""
+    return AsyncMock(spec=ProductRepository)
+
+
+@pytest.fixture
+def product_service(mock_repository):
+    """ProductService wired to the mock repository"""
+    return ProductService(repository=mock_repository)
+
+
+@pytest.fixture
+def mock_product_service():
+    """Mock ProductService restricted to the real service interface"""
+    return AsyncMock(spec=ProductService)
+
+
 # Product fixtures
 @pytest.fixture
 def sample_product_data():
@@ -57,9 +73,9 @@ def sample_product_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_product_create():
-    """Sample ProductCreate schema for testing"""
+    """Sample ProductCreate schema for testing, validated once per session"""
     return ProductCreate(
         name="Test Product",
         price=29.99,
@@ -70,11 +86,17 @@ def sample_product_create():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def sample_product_update():
+    """Sample ProductUpdate schema for testing, validated once per session"""
+    return ProductUpdate(name="Updated Product", price=39.99)
+
+
+@pytest.fixture(scope="module")
 def sample_product_model():
     """Sample Product model for testing"""
     return Product(
-        id="507f1f77bcf86cd799439011",
+        id=PRODUCT_ID,
         name="Test Product",
         price=29.99,
         description="A great test product",
@@ -85,11 +107,11 @@ def sample_product_model():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_product_doc():
     """Mock product document from MongoDB"""
     return {
-        "_id": ObjectId("507f1f77bcf86cd799439011"),
+        "_id": ObjectId(PRODUCT_ID),
         "name": "Test Product",
         "price": 29.99,
         "description": "A great test product",
@@ -98,8 +120,8 @@ def mock_product_doc():
         "sku": "TEST-001",
         "in_stock": True,
         "created_by": "user123",
-        "created_at": datetime.now(UTC),
-        "updated_at": datetime.now(UTC)
+        "created_at": FROZEN_NOW,
+        "updated_at": FROZEN_NOW
     }
 
 
@@ -128,7 +150,7 @@ def admin_user():
 @pytest.fixture
 def product_id():
     """Sample product ID for testing"""
-    return "507f1f77bcf86cd799439011"
+    return PRODUCT_ID
 
 
 @pytest.fixture
@@ -139,16 +161,23 @@ def invalid_product_id():
 
 # API client fixtures
 @pytest.fixture
-def test_client():
-    """Test client for e2e testing"""
-    return TestClient(app)
+def override_dependencies():
+    """Install FastAPI dependency overrides for one test, removing only those it set"""
+    installed = []
 
+    def apply(overrides):
+        for dependency, replacement in overrides.items():
+            app.dependency_overrides[dependency] = replacement
+            installed.append(dependency)
 
-@pytest.fixture
+    yield apply
+
+    for dependency in installed:
+        app.dependency_overrides.pop(dependency, None)
+
+
+@pytest_asyncio.fixture(scope="session")
 async def async_test_client():
-    """Async test client for e2e testing"""
-    # This would be used for async e2e tests
-    # from httpx import AsyncClient
-    # async with AsyncClient(app=app, base_url="http://test") as client:
-    #     yield client
-    yield None
\ No newline at end of file
+    """Async test client for e2e testing, driving the ASGI app in-process and shared across the session"""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
\ No newline at end of file
@@ -0,0 +1,4 @@
+"""Constants shared by test modules that need them at import time"""
+
+# ObjectId string of the sample product used across unit and e2e tests
+PRODUCT_ID = "507f1f77bcf86cd799439011"
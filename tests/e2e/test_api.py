@@ -1,25 +1,101 @@
 """End-to-end tests for the product API"""
 import pytest
-from httpx import AsyncClient
-from fastapi.testclient import TestClient
-
-from main import app
+import pytest_asyncio
+
+from app.core.errors import ErrorResponse
+from app.dependencies.auth import get_current_user
+from app.dependencies.product import get_product_service
+from app.models.user import User
+from app.schemas.product import ProductResponse
+from tests.constants import PRODUCT_ID
+
+
+# Users are immutable here, so they are built once per module
+_USER = User(id="user123", email="user@example.com", roles=["user"])
+_ADMIN = User(id="admin123", email="admin@example.com", roles=["admin", "user"])
+
+
+async def _as_user():
+    """Dependency override authenticating as _USER"""
+    return _USER
+
+
+async def _as_admin():
+    """Dependency override authenticating as _ADMIN"""
+    return _ADMIN
+
+
+_PRODUCT_URL = f"/api/products/{PRODUCT_ID}"
+
+# Request bodies are shared by the tests rather than rebuilt in each one
+_CREATE_PAYLOAD = {
+    "name": "E2E Test Product",
+    "price": 99.99,
+    "sku": "E2E-TEST-001",
+    "description": "End-to-end test product",
+    "category": "Testing"
+}
+_UPDATE_PAYLOAD = {"name": "Updated E2E Product", "price": 149.99}
+_INVALID_PAYLOAD = {
+    "name": "",  # Invalid: empty name
+    "price": -10,  # Invalid: negative price
+}
+
+_PRODUCT = ProductResponse(
+    id=PRODUCT_ID,
+    name="E2E Test Product",
+    price=99.99,
+    sku="E2E-TEST-001",
+    created_by="user123"
+)
+# Routes serialize response models by alias
+_PRODUCT_JSON = _PRODUCT.model_dump(mode="json", by_alias=True)
+_PRODUCT_PAGE = {
+    "products": [_PRODUCT.model_dump(mode="json")],
+    "total_count": 1,
+    "current_page": 1,
+    "total_pages": 1,
+}
+_DEFAULT_FILTERS = {
+    "search_text": None,
+    "department": None,
+    "category": None,
+    "subcategory": None,
+    "min_price": None,
+    "max_price": None,
+    "tags": None,
+    "skip": 0,
+    "limit": None,
+}
+_NOT_FOUND = ErrorResponse("Product not found", status_code=404)
+
+
+@pytest_asyncio.fixture(scope="module", autouse=True)
+async def warm_up_app(async_test_client):
+    """Build the OpenAPI schema and route validators once before the first test"""
+    response = await async_test_client.get("/openapi.json")
+    assert response.status_code == 200
 
 
 class TestProductAPIEndToEnd:
     """End-to-end tests for the complete product workflow"""
 
     @pytest.fixture(autouse=True)
-    def setup_test_client(self):
-        """Set up test client for e2e tests"""
-        self.client = TestClient(app)
-        # In a real setup, this would use a test database
-        # and clean up after each test
+    def setup_test_client(self, async_test_client, override_dependencies, mock_product_service):
+        """Set up the test client with the product service replaced by a mock"""
+        self.client = async_test_client
+        self.service = mock_product_service
+        self.override_dependencies = override_dependencies
+
+        async def _service():
+            return mock_product_service
+
+        override_dependencies({get_product_service: _service})
 
-    def test_health_endpoints(self):
+    async def test_health_endpoints(self):
         """Test health check endpoints"""
         # Test liveness
-        response = self.client.get("/api/health/live")
+        response = await self.client.get("/api/health/live")
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "alive"  # Updated to match actual response
@@ -27,7 +103,7 @@ class TestProductAPIEndToEnd:
 
         # Test readiness - will return 503 when dependencies (DB, Dapr) are not available
         # This is the correct behavior for sophisticated health checks
-        response = self.client.get("/api/health/ready")
+        response = await self.client.get("/api/health/ready")
         data = response.json()
         
         # In test environment without proper DB/Dapr setup, expect 503
@@ -50,128 +126,125 @@ class TestProductAPIEndToEnd:
             assert data["status"] == "ready"
             assert data["service"] == "product-service"
 
-    def test_root_endpoint(self):
+    async def test_root_endpoint(self):
         """Test the root endpoint"""
-        response = self.client.get("/")
+        response = await self.client.get("/")
         assert response.status_code == 200
         data = response.json()
         assert data["service"] == "product-service"
         assert "message" in data
 
-    def test_complete_product_workflow(self):
-        """Test complete CRUD workflow for products"""
-        # This would test the full workflow but requires database setup
-        # For now, it's a placeholder showing the structure
-        
-        # 1. Create a product
-        product_data = {
-            "name": "E2E Test Product",
-            "price": 99.99,
-            "sku": "E2E-TEST-001",
-            "description": "End-to-end test product",
-            "category": "Testing"
-        }
-        
-        # In a real e2e test:
-        # create_response = self.client.post("/api/products/", json=product_data)
-        # assert create_response.status_code == 201
-        # created_product = create_response.json()
-        # product_id = created_product["id"]
-
-        # 2. Get the product
-        # get_response = self.client.get(f"/api/products/{product_id}")
-        # assert get_response.status_code == 200
-        # assert get_response.json()["name"] == "E2E Test Product"
-
-        # 3. Update the product
-        # update_data = {"name": "Updated E2E Product", "price": 149.99}
-        # update_response = self.client.put(f"/api/products/{product_id}", json=update_data)
-        # assert update_response.status_code == 200
-        # assert update_response.json()["name"] == "Updated E2E Product"
-
-        # 4. List products (should include our product)
-        # list_response = self.client.get("/api/products/")
-        # assert list_response.status_code == 200
-        # products = list_response.json()
-        # assert any(p["id"] == product_id for p in products)
-
-        # 5. Search products
-        # search_response = self.client.get("/api/products/search?q=E2E")
-        # assert search_response.status_code == 200
-        # search_results = search_response.json()
-        # assert any(p["id"] == product_id for p in search_results)
-
-        # 6. Delete the product
-        # delete_response = self.client.delete(f"/api/products/{product_id}")
-        # assert delete_response.status_code == 200
-
-        # 7. Verify deletion
-        # get_deleted_response = self.client.get(f"/api/products/{product_id}")
-        # assert get_deleted_response.status_code == 404
-
-        # For now, just assert the test data structure
-        assert product_data["name"] == "E2E Test Product"
-        assert product_data["sku"] == "E2E-TEST-001"
-
-    def test_error_handling_e2e(self):
+    @pytest.mark.parametrize(
+        "method,url,body,service_method,service_return,expected_status",
+        [
+            ("post", "/api/products/", _CREATE_PAYLOAD, "create_product", _PRODUCT, 201),
+            ("patch", _PRODUCT_URL, _UPDATE_PAYLOAD, "update_product", _PRODUCT, 200),
+            ("delete", _PRODUCT_URL, None, "delete_product", None, 204),
+        ],
+        ids=["create", "update", "delete"],
+    )
+    async def test_write_endpoints_e2e(
+        self, method, url, body, service_method, service_return, expected_status
+    ):
+        """Test the authenticated create, update and delete endpoints"""
+        self.override_dependencies({get_current_user: _as_user})
+        getattr(self.service, service_method).return_value = service_return
+
+        response = await self.client.request(method, url, json=body)
+
+        assert response.status_code == expected_status
+        if service_return is None:
+            assert response.content == b""
+        else:
+            assert response.json() == _PRODUCT_JSON
+        getattr(self.service, service_method).assert_called_once()
+
+    async def test_error_handling_e2e(self):
         """Test error handling in the API"""
-        # NOTE: This test will fail with database authentication issues
-        # For a proper e2e test, we would need a test database setup
-        # For now, we'll just test invalid endpoints that don't hit the database
+        # Authentication is overridden so the request reaches body validation
+        self.override_dependencies({get_current_user: _as_user})
         
         # Test invalid endpoint
-        response = self.client.get("/api/invalid-endpoint")
+        response = await self.client.get("/api/invalid-endpoint")
         assert response.status_code == 404
 
         # Test validation errors with invalid data
-        invalid_product = {
-            "name": "",  # Invalid: empty name
-            "price": -10,  # Invalid: negative price
-        }
-        
-        # This would test validation but requires proper database setup:
-        # create_response = self.client.post("/api/products/", json=invalid_product)
-        # assert create_response.status_code == 422
+        create_response = await self.client.post("/api/products/", json=_INVALID_PAYLOAD)
+        assert create_response.status_code == 422
+        data = create_response.json()
+        assert data["error"] == "Validation error"
+        assert {tuple(error["loc"]) for error in data["details"]} == {("body", "name"), ("body", "price")}
+
+    @pytest.mark.parametrize(
+        "method,url,body",
+        [
+            ("post", "/api/products/", _CREATE_PAYLOAD),
+            ("patch", _PRODUCT_URL, _UPDATE_PAYLOAD),
+            ("delete", _PRODUCT_URL, None),
+            ("patch", f"{_PRODUCT_URL}/reactivate", None),
+        ],
+        ids=["create", "update", "delete", "reactivate"],
+    )
+    async def test_write_endpoints_require_authentication(self, method, url, body):
+        """Test that write endpoints reject requests without a bearer token"""
+        response = await self.client.request(method, url, json=body)
+
+        assert response.status_code == 401
+        assert response.json()["detail"] == "Unauthorized: No token found in Authorization header"
+        assert self.service.mock_calls == []
+
+    @pytest.mark.parametrize(
+        "service_method,method,url,body",
+        [
+            ("get_product", "get", _PRODUCT_URL, None),
+            ("update_product", "patch", _PRODUCT_URL, _UPDATE_PAYLOAD),
+            ("delete_product", "delete", _PRODUCT_URL, None),
+        ],
+        ids=["get", "update", "delete"],
+    )
+    async def test_product_not_found_e2e(self, service_method, method, url, body):
+        """Test that a missing product surfaces as a 404 error response"""
+        self.override_dependencies({get_current_user: _as_user})
+        getattr(self.service, service_method).side_effect = _NOT_FOUND
+
+        response = await self.client.request(method, url, json=body)
 
-        # For now, just verify the error structure
-        assert invalid_product["price"] == -10
+        assert response.status_code == 404
+        assert response.json()["error"] == "Product not found"
+        getattr(self.service, service_method).assert_called_once()
+
+    @pytest.mark.parametrize(
+        "current_user,expected_status",
+        [(_as_user, 403), (_as_admin, 200)],
+        ids=["user", "admin"],
+    )
+    async def test_reactivate_requires_admin(self, current_user, expected_status):
+        """Test that only administrators can reactivate a product"""
+        self.override_dependencies({get_current_user: current_user})
+        self.service.reactivate_product.return_value = _PRODUCT
+
+        response = await self.client.patch(f"{_PRODUCT_URL}/reactivate")
+
+        assert response.status_code == expected_status
+        assert self.service.reactivate_product.called is (expected_status == 200)
+
+    @pytest.mark.parametrize(
+        "url,expected_filters",
+        [
+            ("/api/products", {}),
+            ("/api/products?category=Electronics", {"category": "Electronics"}),
+            ("/api/products?skip=5&limit=5", {"skip": 5, "limit": 5}),
+            ("/api/products/search?q=electronics", {"search_text": "electronics"}),
+        ],
+        ids=["list", "category", "pagination", "search"],
+    )
+    async def test_list_products_e2e(self, url, expected_filters):
+        """Test that listing and search query strings reach the service as filters"""
+        self.service.get_products.return_value = _PRODUCT_PAGE
+
+        response = await self.client.get(url)
 
-    def test_product_search_e2e(self):
-        """Test product search functionality end-to-end"""
-        # This would test search with real data
-        search_term = "electronics"
-        
-        # This requires database setup:
-        # response = self.client.get(f"/api/products/search?q={search_term}")
-        # assert response.status_code == 200
-        # results = response.json()
-        # # Verify search results contain the search term
-        # assert all(
-        #     search_term.lower() in (p.get("name", "").lower() + 
-        #                           p.get("category", "").lower() + 
-        #                           p.get("description", "").lower())
-        #     for p in results
-        # )
-
-        assert search_term == "electronics"
-
-    def test_pagination_e2e(self):
-        """Test pagination in the API"""
-        # Test first page
-        # response = self.client.get("/api/products/?skip=0&limit=5")
-        # assert response.status_code == 200
-        # page_1 = response.json()
-        # assert len(page_1) <= 5
-
-        # Test second page
-        # response = self.client.get("/api/products/?skip=5&limit=5")
-        # assert response.status_code == 200
-        # page_2 = response.json()
-        # assert len(page_2) <= 5
-
-        # Verify different results (if we have enough data)
-        # if len(page_1) == 5 and len(page_2) > 0:
-        #     assert page_1[0]["id"] != page_2[0]["id"]
-
-        # For now, just verify pagination parameters
-        assert 0 >= 0 and 5 > 0
\ No newline at end of file
+        assert response.status_code == 200
+        assert response.json() == _PRODUCT_PAGE
+        filters = {**_DEFAULT_FILTERS, **expected_filters}
+        self.service.get_products.assert_called_once_with(**filters)
@@ -8,12 +8,40 @@ from datetime import datetime, UTC
 
 import aiohttp
 import pytest
-from motor.motor_asyncio import AsyncIOMotorClient
 
 from app.core.config import config
 from app.events.publishers.publisher import DaprEventPublisher
 
 
+# Event payloads are built once at import rather than inside each test
+_TIMESTAMP = datetime(2024, 1, 1, tzinfo=UTC).isoformat()
+_TEST_EVENT = {
+    "specversion": "1.0",
+    "type": "test.event",
+    "source": "/test",
+    "id": "test-123",
+    "data": {"message": "Test event from integration tests"}
+}
+_CREATED_PRODUCT = {
+    "_id": "test-product-integration-123",
+    "name": "Integration Test Product",
+    "sku": "TEST-DAPR-001",
+    "price": 29.99,
+    "stock": 100,
+    "created_at": _TIMESTAMP,
+    "updated_at": _TIMESTAMP
+}
+_UPDATED_PRODUCT = {
+    "_id": "test-product-integration-456",
+    "name": "Updated Integration Test Product",
+    "sku": "TEST-DAPR-002",
+    "price": 39.99,
+    "stock": 50,
+    "created_at": _TIMESTAMP,
+    "updated_at": _TIMESTAMP
+}
+
+
 class TestDaprIntegration:
     """Integration tests for Dapr sidecar and building blocks"""
 
@@ -68,19 +96,11 @@ class TestDaprIntegration:
         pubsub_name = os.getenv('DAPR_PUBSUB_NAME', 'product-pubsub')
         url = f"http://localhost:{dapr_port}/v1.0/publish/{pubsub_name}/test-topic"
         
-        test_event = {
-            "specversion": "1.0",
-            "type": "test.event",
-            "source": "/test",
-            "id": "test-123",
-            "data": {"message": "Test event from integration tests"}
-        }
-        
         async with aiohttp.ClientSession() as session:
             try:
                 async with session.post(
                     url,
-                    json=test_event,
+                    json=_TEST_EVENT,
                     headers={"Content-Type": "application/json"},
                     timeout=aiohttp.ClientTimeout(total=5.0)
                 ) as response:
@@ -103,19 +123,9 @@ class TestDaprIntegration:
     @pytest.mark.asyncio
     async def test_dapr_publisher_product_created_event(self, dapr_publisher):
         """Test publishing product.created event through DaprEventPublisher"""
-        test_product_data = {
-            "_id": "test-product-integration-123",
-            "name": "Integration Test Product",
-            "sku": "TEST-DAPR-001",
-            "price": 29.99,
-            "stock": 100,
-            "created_at": datetime.now(UTC).isoformat(),
-            "updated_at": datetime.now(UTC).isoformat()
-        }
-        
         try:
             success = await dapr_publisher.publish_product_created(
-                test_product_data, 
+                _CREATED_PRODUCT,
                 "test-correlation-integration-123"
             )
             assert success, "Failed to publish product.created event"
@@ -125,19 +135,9 @@ class TestDaprIntegration:
     @pytest.mark.asyncio
     async def test_dapr_publisher_product_updated_event(self, dapr_publisher):
         """Test publishing product.updated event through DaprEventPublisher"""
-        test_product_data = {
-            "_id": "test-product-integration-456",
-            "name": "Updated Integration Test Product",
-            "sku": "TEST-DAPR-002",
-            "price": 39.99,
-            "stock": 50,
-            "created_at": datetime.now(UTC).isoformat(),
-            "updated_at": datetime.now(UTC).isoformat()
-        }
-        
         try:
             success = await dapr_publisher.publish_product_updated(
-                test_product_data,
+                _UPDATED_PRODUCT,
                 "test-correlation-integration-456"
             )
             assert success, "Failed to publish product.updated event"
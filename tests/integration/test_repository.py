@@ -1,14 +1,15 @@
 """Integration tests for product repository (database access)"""
 import pytest
-from datetime import datetime
-from motor.motor_asyncio import AsyncIOMotorClient
+from datetime import datetime, UTC
 
 from app.repositories.product import ProductRepository
 from app.models.product import Product
-from app.schemas.product import ProductCreate, ProductUpdate
+from app.schemas.product import ProductUpdate
+
+
+_NOW = datetime(2024, 1, 1, tzinfo=UTC)
 
 
-@pytest.mark.asyncio
 class TestProductRepositoryIntegration:
     """Integration tests for ProductRepository with real database"""
 
@@ -18,7 +19,7 @@ class TestProductRepositoryIntegration:
         # This would be configured in conftest.py with a test database
         # For now, we'll use mocks to show the structure
         self.client = None  # Would be AsyncIOMotorClient("mongodb://test-db")
-        self.repository = ProductRepository(db=None)  # Would use test database
+        self.repository = ProductRepository(collection=None)  # Would use test database
         
         yield
         
@@ -37,8 +38,8 @@ class TestProductRepositoryIntegration:
             sku="INT-TEST-001",
             category="Testing",
             created_by="test_user",
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
+            created_at=_NOW,
+            updated_at=_NOW
         )
         
         # result = await self.repository.create(product_data)
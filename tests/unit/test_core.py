@@ -1,39 +1,51 @@
 """Unit tests for core error handling"""
+import json
+
 import pytest
 from unittest.mock import Mock, patch
 from fastapi import HTTPException
-from fastapi.responses import JSONResponse
 
-from app.core.errors import ErrorResponse, error_response_handler, http_exception_handler
+from app.core.errors import (
+    ErrorResponse,
+    ORJSONResponse,
+    error_response_handler,
+    http_exception_handler,
+)
 
 
 class TestErrorResponse:
     """Test ErrorResponse exception class"""
 
-    def test_error_response_creation(self):
-        """Test creating an ErrorResponse"""
-        error = ErrorResponse("Something went wrong", status_code=400)
-        assert error.message == "Something went wrong"
-        assert error.status_code == 400
-        assert error.details == {}
-
-    def test_error_response_with_details(self):
-        """Test creating an ErrorResponse with details"""
-        details = {"field": "user_id", "issue": "required"}
-        error = ErrorResponse("Validation failed", status_code=422, details=details)
-        assert error.message == "Validation failed"
-        assert error.status_code == 422
-        assert error.details == details
-
-    def test_error_response_default_status_code(self):
-        """Test that ErrorResponse defaults to status code 400"""
-        error = ErrorResponse("Bad request")
-        assert error.status_code == 400
-
-    def test_error_response_str(self):
-        """Test string representation of ErrorResponse"""
-        error = ErrorResponse("Test error")
-        assert str(error) == "Test error"
+    @pytest.mark.parametrize(
+        "message,kwargs,expected_status,expected_details",
+        [
+            ("Something went wrong", {"status_code": 400}, 400, {}),
+            (
+                "Validation failed",
+                {"status_code": 422, "details": {"field": "user_id", "issue": "required"}},
+                422,
+                {"field": "user_id", "issue": "required"},
+            ),
+            ("Bad request", {}, 400, {}),
+            (
+                "Multiple validation errors",
+                {
+                    "status_code": 422,
+                    "details": {"product_id": "missing", "user_id": "invalid", "rating": "out_of_range"},
+                },
+                422,
+                {"product_id": "missing", "user_id": "invalid", "rating": "out_of_range"},
+            ),
+        ],
+        ids=["creation", "with_details", "default_status_code", "multiple_details"],
+    )
+    def test_error_response_fields(self, message, kwargs, expected_status, expected_details):
+        """Test ErrorResponse message, status code, details and string representation"""
+        error = ErrorResponse(message, **kwargs)
+        assert error.message == message
+        assert str(error) == message
+        assert error.status_code == expected_status
+        assert error.details == expected_details
 
     def test_error_response_inheritance(self):
         """Test that ErrorResponse properly inherits from Exception"""
@@ -45,19 +57,6 @@ class TestErrorResponse:
             raise error
         assert exc_info.value.message == "Test error"
 
-    def test_multiple_error_details(self):
-        """Test ErrorResponse with multiple detail fields"""
-        details = {
-            "product_id": "missing",
-            "user_id": "invalid",
-            "rating": "out_of_range"
-        }
-        error = ErrorResponse("Multiple validation errors", status_code=422, details=details)
-        
-        assert error.details["product_id"] == "missing"
-        assert error.details["user_id"] == "invalid"
-        assert error.details["rating"] == "out_of_range"
-
 
 class TestErrorHandlers:
     """Test error handler functions"""
@@ -76,13 +75,11 @@ class TestErrorHandlers:
             response = await error_response_handler(mock_request, error)
         
         # Verify response
-        assert isinstance(response, JSONResponse)
+        assert isinstance(response, ORJSONResponse)
         assert response.status_code == 404
         
         # Check response content
-        content = response.body.decode()
-        assert "Test error" in content
-        assert "123" in content
+        assert json.loads(response.body) == {"error": "Test error", "details": {"id": "123"}}
 
     @pytest.mark.asyncio
     async def test_error_response_handler_no_details(self):
@@ -93,8 +90,9 @@ class TestErrorHandlers:
         with patch('app.core.errors.logger') as mock_logger:
             response = await error_response_handler(mock_request, error)
         
-        assert isinstance(response, JSONResponse)
+        assert isinstance(response, ORJSONResponse)
         assert response.status_code == 500
+        assert json.loads(response.body) == {"error": "Simple error", "details": {}}
 
     @pytest.mark.asyncio
     async def test_http_exception_handler(self):
@@ -110,9 +108,8 @@ class TestErrorHandlers:
             response = await http_exception_handler(mock_request, exception)
         
         # Verify response
-        assert isinstance(response, JSONResponse)
+        assert isinstance(response, ORJSONResponse)
         assert response.status_code == 403
         
         # Check response content
-        content = response.body.decode()
-        assert "Forbidden" in content
\ No newline at end of file
+        assert json.loads(response.body) == {"error": "Forbidden"}
\ No newline at end of file
@@ -1,141 +1,125 @@
 """Unit tests for product models and schemas"""
 import pytest
-from datetime import datetime
 from pydantic import ValidationError
 
-from app.models.product import Product, ProductBase
+from app.models.product import ProductBase
 from app.schemas.product import ProductCreate, ProductUpdate, ProductResponse
+from tests.constants import PRODUCT_ID
+
+
+# Minimal valid ProductCreate input; cases override a single field
+VALID_CREATE_FIELDS = {"name": "Test", "price": 10.0, "sku": "TEST-001"}
+
+# Inputs that should round-trip unchanged through model_dump
+BASE_PRODUCT_FIELDS = {"name": "Base Product", "price": 19.99, "sku": "BASE-001", "created_by": "user123"}
+RESPONSE_FIELDS = {
+    "id": PRODUCT_ID,
+    "name": "Test Product",
+    "price": 29.99,
+    "sku": "TEST-001",
+    "created_by": "user123"
+}
 
 
 class TestProductModel:
     """Test Product domain model"""
 
-    def test_product_model_creation(self):
+    def test_product_model_creation(self, sample_product_model):
         """Test creating a Product model"""
-        now = datetime.utcnow()
-        product = Product(
-            id="507f1f77bcf86cd799439011",
-            name="Test Product",
-            price=29.99,
-            description="A great test product",
-            category="Electronics",
-            brand="TestBrand",
-            sku="TEST-001",
-            created_by="admin123"
-        )
+        product = sample_product_model
         assert product.name == "Test Product"
         assert product.price == 29.99
         assert product.sku == "TEST-001"
-        assert product.id == "507f1f77bcf86cd799439011"
+        assert product.id == PRODUCT_ID
 
     def test_product_base_model(self):
         """Test ProductBase model without ID"""
-        product = ProductBase(
-            name="Base Product",
-            price=19.99,
-            sku="BASE-001",
-            created_by="user123"
-        )
-        assert product.name == "Base Product"
-        assert product.created_by == "user123"
+        product = ProductBase(**BASE_PRODUCT_FIELDS)
+        assert product.model_dump(include=set(BASE_PRODUCT_FIELDS)) == BASE_PRODUCT_FIELDS
 
 
 class TestProductSchemas:
     """Test product API schemas"""
 
-    def test_product_create_schema(self):
+    def test_product_create_schema(self, sample_product_create):
         """Test ProductCreate schema validation"""
-        product_data = {
-            "name": "Test Product",
-            "price": 29.99,
-            "description": "A great test product",
-            "category": "Electronics",
-            "brand": "TestBrand",
-            "sku": "TEST-001"
-        }
-        product = ProductCreate(**product_data)
+        product = sample_product_create
         assert product.name == "Test Product"
         assert product.price == 29.99
         assert product.sku == "TEST-001"
 
-    def test_product_create_name_validation(self):
-        """Test product name validation in ProductCreate"""
-        # Test valid names
-        valid_names = ["Product", "A", "x" * 100]  # 1 to 100 characters
-        for name in valid_names:
-            product = ProductCreate(name=name, price=10.0, sku="TEST-001")
-            assert product.name == name
-
-        # Test empty name
-        with pytest.raises(ValidationError) as exc_info:
-            ProductCreate(name="", price=10.0, sku="TEST-001")
-        errors = exc_info.value.errors()
-        assert any("String should have at least 1 character" in str(error) for error in errors)
-
-        # Test name too long (over 255 characters)
-        with pytest.raises(ValidationError) as exc_info:
-            ProductCreate(name="x" * 256, price=10.0, sku="TEST-001")
-        errors = exc_info.value.errors()
-        assert any("String should have at most 255 characters" in str(error) for error in errors)
-
-    def test_product_create_price_validation(self):
-        """Test product price validation"""
-        # Test valid prices
-        valid_prices = [0.0, 0.01, 1.0, 999999.99]  # Updated to include 0
-        for price in valid_prices:
-            product = ProductCreate(name="Test", price=price, sku="TEST-001")
-            assert product.price == price
-
-        # Test negative price
+    @pytest.mark.parametrize(
+        "field,value",
+        [
+            ("name", "Product"),
+            ("name", "A"),
+            ("name", "x" * 100),
+            ("price", 0.0),
+            ("price", 0.01),
+            ("price", 1.0),
+            ("price", 999999.99),
+            ("sku", "A"),
+            ("sku", "SKU-123"),
+            ("sku", "PROD_001"),
+            ("sku", "x" * 50),
+            ("sku", None),
+        ],
+        ids=[
+            "name_typical",
+            "name_min_len",
+            "name_max_len",
+            "price_zero",
+            "price_cent",
+            "price_one",
+            "price_large",
+            "sku_min_len",
+            "sku_hyphen",
+            "sku_underscore",
+            "sku_max_len",
+            "sku_none",
+        ],
+    )
+    def test_product_create_valid_field(self, field, value):
+        """Test ProductCreate accepts valid names, prices and SKUs"""
+        product = ProductCreate(**{**VALID_CREATE_FIELDS, field: value})
+        assert getattr(product, field) == value
+
+    @pytest.mark.parametrize(
+        "field,value,error_type",
+        [
+            ("name", "", "string_too_short"),
+            ("name", "x" * 256, "string_too_long"),
+            ("price", -1.0, "greater_than_equal"),
+            ("sku", "x" * 51, "string_too_long"),
+        ],
+        ids=["empty_name", "name_too_long", "negative_price", "sku_too_long"],
+    )
+    def test_product_create_invalid_field(self, field, value, error_type):
+        """Test ProductCreate rejects invalid names, prices and SKUs"""
         with pytest.raises(ValidationError) as exc_info:
-            ProductCreate(name="Test", price=-1.0, sku="TEST-001")
+            ProductCreate(**{**VALID_CREATE_FIELDS, field: value})
         errors = exc_info.value.errors()
-        assert any("Input should be greater than or equal to 0" in str(error) for error in errors)
-
-    def test_product_create_sku_validation(self):
-        """Test product SKU validation"""
-        # Test valid SKUs
-        valid_skus = ["A", "SKU-123", "PROD_001", "x" * 50]
-        for sku in valid_skus:
-            product = ProductCreate(name="Test", price=10.0, sku=sku)
-            assert product.sku == sku
-
-        # Test None SKU (should be allowed)
-        product = ProductCreate(name="Test", price=10.0, sku=None)
-        assert product.sku is None
-
-        # Test SKU too long (over 50 characters)
-        with pytest.raises(ValidationError) as exc_info:
-            ProductCreate(name="Test", price=10.0, sku="x" * 51)
-        errors = exc_info.value.errors()
-        assert any("String should have at most 50 characters" in str(error) for error in errors)
-
-    def test_product_update_schema(self):
+        assert [(error["type"], error["loc"]) for error in errors] == [(error_type, (field,))]
+
+    @pytest.mark.parametrize(
+        "update_fields",
+        [
+            {"name": "Updated Name"},
+            {"price": 99.99, "description": "Updated description"},
+        ],
+        ids=["name_only", "price_and_description"],
+    )
+    def test_product_update_schema(self, update_fields):
         """Test ProductUpdate schema allows partial updates"""
-        # Test partial update with just name
-        update = ProductUpdate(name="Updated Name")
-        assert update.name == "Updated Name"
-        assert update.price is None
-        assert update.description is None
-
-        # Test partial update with price and description
-        update = ProductUpdate(price=99.99, description="Updated description")
-        assert update.price == 99.99
-        assert update.description == "Updated description"
-        assert update.name is None
+        update = ProductUpdate(**update_fields)
+        assert update.model_fields_set == set(update_fields)
+        for field in ("name", "price", "description"):
+            assert getattr(update, field) == update_fields.get(field)
 
     def test_product_response_schema(self):
         """Test ProductResponse schema"""
-        response_data = {
-            "id": "507f1f77bcf86cd799439011",
-            "name": "Test Product", 
-            "price": 29.99,
-            "sku": "TEST-001",
-            "created_by": "user123"
-        }
-        response = ProductResponse(**response_data)
-        assert response.id == "507f1f77bcf86cd799439011"
-        assert response.name == "Test Product"
+        response = ProductResponse(**RESPONSE_FIELDS)
+        assert response.model_dump(include=set(RESPONSE_FIELDS)) == RESPONSE_FIELDS
 
     def test_product_create_optional_fields(self):
         """Test ProductCreate with optional fields"""
@@ -1,225 +1,182 @@
 """Unit tests for product services (business logic)"""
 import pytest
-from unittest.mock import Mock, AsyncMock, patch
-from datetime import datetime
+from unittest.mock import AsyncMock, patch
 
-from app.services.product import ProductService
-from app.schemas.product import ProductCreate, ProductUpdate, ProductResponse
+from app.events.publishers.publisher import DaprEventPublisher
+from app.schemas.product import ProductUpdate, ProductResponse
 from app.core.errors import ErrorResponse
+from tests.constants import PRODUCT_ID
+
+
+# Response models are only read by the service, so they are built once
+PRODUCT = ProductResponse(
+    id=PRODUCT_ID,
+    name="Test Product",
+    price=29.99,
+    sku="TEST-001",
+    created_by="user123"
+)
+UPDATED_PRODUCT = ProductResponse(
+    id=PRODUCT_ID,
+    name="Updated Product",
+    price=39.99,
+    sku="TEST-001",
+    created_by="user123"
+)
+NAME_ONLY_UPDATE = ProductUpdate(name="Updated Product")
+PRODUCTS = [
+    ProductResponse(id="1", name="Product 1", price=10.0, sku="SKU-1", created_by="user1"),
+    ProductResponse(id="2", name="Product 2", price=20.0, sku="SKU-2", created_by="user2")
+]
+
+
+@pytest.fixture(scope="class")
+def mock_event_publisher():
+    """Patch the Dapr event publisher once for each test class"""
+    with patch(
+        "app.services.product.event_publisher", new=AsyncMock(spec=DaprEventPublisher)
+    ) as publisher:
+        yield publisher
 
 
 class TestProductService:
     """Test ProductService business logic"""
 
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup_service(self, mock_repository, product_service, mock_event_publisher):
         """Set up test fixtures"""
-        self.mock_repository = AsyncMock()
-        self.service = ProductService(repository=self.mock_repository)
+        mock_event_publisher.reset_mock(return_value=True, side_effect=True)
+        self.mock_repository = mock_repository
+        self.mock_event_publisher = mock_event_publisher
+        self.service = product_service
 
     @pytest.mark.asyncio
-    async def test_create_product_success(self):
+    async def test_create_product_success(self, sample_product_create):
         """Test successful product creation"""
         # Arrange
-        product_data = ProductCreate(
-            name="Test Product",
-            price=29.99,
-            sku="TEST-001",
-            category="Electronics"
-        )
-        
-        created_product = ProductResponse(
-            id="507f1f77bcf86cd799439011",
-            name="Test Product",
-            price=29.99,
-            sku="TEST-001",
-            category="Electronics",
-            created_by="user123"
-        )
-        
         self.mock_repository.check_sku_exists.return_value = False  # No duplicate SKU
-        self.mock_repository.create.return_value = created_product
+        self.mock_repository.create.return_value = PRODUCT
 
         # Act
-        result = await self.service.create_product(product_data, created_by="user123")
+        result = await self.service.create_product(sample_product_create, created_by="user123")
 
         # Assert
-        assert result == created_product
+        assert result == PRODUCT
         self.mock_repository.check_sku_exists.assert_called_once_with("TEST-001")
         self.mock_repository.create.assert_called_once()
+        self.mock_event_publisher.publish_product_created.assert_awaited_once()
 
     @pytest.mark.asyncio
-    async def test_create_product_duplicate_sku(self):
+    async def test_create_product_duplicate_sku(self, sample_product_create):
         """Test product creation with duplicate SKU"""
         # Arrange
-        product_data = ProductCreate(
-            name="Test Product",
-            price=29.99,
-            sku="TEST-001"
-        )
-        
         self.mock_repository.check_sku_exists.return_value = True
 
         # Act & Assert
         with pytest.raises(ErrorResponse) as exc_info:
-            await self.service.create_product(product_data, created_by="user123")
+            await self.service.create_product(sample_product_create, created_by="user123")
         
         assert "A product with this SKU already exists" in exc_info.value.message
         assert exc_info.value.status_code == 400
         self.mock_repository.check_sku_exists.assert_called_once_with("TEST-001")
         self.mock_repository.create.assert_not_called()
+        self.mock_event_publisher.publish_product_created.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_update_product_success(self):
+    async def test_update_product_success(self, sample_product_update):
         """Test successful product update"""
         # Arrange
-        product_id = "507f1f77bcf86cd799439011"
-        update_data = ProductUpdate(name="Updated Product", price=39.99)
-        
-        updated_product = ProductResponse(
-            id=product_id,
-            name="Updated Product",
-            price=39.99,
-            sku="TEST-001",
-            created_by="user123"
-        )
-        
-        self.mock_repository.update.return_value = updated_product
+        self.mock_repository.update.return_value = UPDATED_PRODUCT
 
         # Act
-        result = await self.service.update_product(product_id, update_data, updated_by="admin")
+        result = await self.service.update_product(PRODUCT_ID, sample_product_update, updated_by="admin")
 
         # Assert
-        assert result == updated_product
-        self.mock_repository.update.assert_called_once_with(product_id, update_data, "admin")
-
-    @pytest.mark.asyncio
-    async def test_update_product_not_found(self):
-        """Test updating non-existent product"""
-        # Arrange
-        product_id = "507f1f77bcf86cd799439011"
-        update_data = ProductUpdate(name="Updated Product")
-        
-        self.mock_repository.update.return_value = None
-
-        # Act & Assert
-        with pytest.raises(ErrorResponse) as exc_info:
-            await self.service.update_product(product_id, update_data, updated_by="admin")
-        
-        assert "Product not found" in exc_info.value.message
-        assert exc_info.value.status_code == 404
+        assert result == UPDATED_PRODUCT
+        self.mock_repository.update.assert_called_once_with(PRODUCT_ID, sample_product_update, "admin")
 
     @pytest.mark.asyncio
     async def test_delete_product_success(self):
         """Test successful product deletion"""
         # Arrange
-        product_id = "507f1f77bcf86cd799439011"
         self.mock_repository.delete.return_value = True
 
         # Act
-        result = await self.service.delete_product(product_id)
+        result = await self.service.delete_product(PRODUCT_ID)
 
         # Assert
         assert result is None  # delete_product returns None
-        self.mock_repository.delete.assert_called_once_with(product_id)
-
-    @pytest.mark.asyncio
-    async def test_delete_product_not_found(self):
-        """Test deleting non-existent product"""
-        # Arrange
-        product_id = "507f1f77bcf86cd799439011"
-        self.mock_repository.delete.return_value = False
-
-        # Act & Assert
-        with pytest.raises(ErrorResponse) as exc_info:
-            await self.service.delete_product(product_id)
-        
-        assert "Product not found" in exc_info.value.message
-        assert exc_info.value.status_code == 404
+        self.mock_repository.delete.assert_called_once_with(PRODUCT_ID)
 
     @pytest.mark.asyncio
     async def test_get_product_success(self):
         """Test getting a product by ID"""
         # Arrange
-        product_id = "507f1f77bcf86cd799439011"
-        product = ProductResponse(
-            id=product_id,
-            name="Test Product",
-            price=29.99,
-            sku="TEST-001",
-            created_by="user123"
-        )
-        
-        self.mock_repository.get_by_id.return_value = product
+        self.mock_repository.get_by_id.return_value = PRODUCT
 
         # Act
-        result = await self.service.get_product(product_id)
+        result = await self.service.get_product(PRODUCT_ID)
 
         # Assert
-        assert result == product
-        self.mock_repository.get_by_id.assert_called_once_with(product_id)
+        assert result == PRODUCT
+        self.mock_repository.get_by_id.assert_called_once_with(PRODUCT_ID)
 
     @pytest.mark.asyncio
-    async def test_get_product_not_found(self):
-        """Test getting non-existent product"""
+    @pytest.mark.parametrize(
+        "repo_method,repo_return,operation",
+        [
+            ("get_by_id", None, lambda service, product_id: service.get_product(product_id)),
+            (
+                "update",
+                None,
+                lambda service, product_id: service.update_product(
+                    product_id, NAME_ONLY_UPDATE, updated_by="admin"
+                ),
+            ),
+            ("delete", False, lambda service, product_id: service.delete_product(product_id)),
+        ],
+        ids=["get", "update", "delete"],
+    )
+    async def test_product_not_found(self, repo_method, repo_return, operation):
+        """Test operations on a non-existent product"""
         # Arrange
-        product_id = "507f1f77bcf86cd799439011"
-        self.mock_repository.get_by_id.return_value = None
+        getattr(self.mock_repository, repo_method).return_value = repo_return
 
         # Act & Assert
         with pytest.raises(ErrorResponse) as exc_info:
-            await self.service.get_product(product_id)
+            await operation(self.service, PRODUCT_ID)
         
         assert "Product not found" in exc_info.value.message
         assert exc_info.value.status_code == 404
 
     @pytest.mark.asyncio
-    async def test_search_products(self):
-        """Test searching products"""
+    @pytest.mark.parametrize(
+        "search_text,repo_method,repo_args",
+        [
+            ("electronics", "search", ("electronics", None, "Electronics", None, 10.0, 100.0, None, 0, 10)),
+            (None, "list_products", (None, "Electronics", None, 10.0, 100.0, None, 0, 10)),
+        ],
+        ids=["search", "list"],
+    )
+    async def test_get_products(self, search_text, repo_method, repo_args):
+        """Test searching and listing products with pagination"""
         # Arrange
-        search_text = "electronics"
-        
-        # Mock repository to return tuple
-        products = [
-            ProductResponse(id="1", name="Product 1", price=10.0, sku="SKU-1", created_by="user1"),
-            ProductResponse(id="2", name="Product 2", price=20.0, sku="SKU-2", created_by="user2")
-        ]
         total_count = 2
-        
-        self.mock_repository.search.return_value = (products, total_count)
+        getattr(self.mock_repository, repo_method).return_value = (PRODUCTS, total_count)
 
         # Act
-        result = await self.service.search_products(
+        result = await self.service.get_products(
             search_text=search_text,
             category="Electronics",
             min_price=10.0,
-            max_price=100.0
+            max_price=100.0,
+            skip=0,
+            limit=10
         )
 
         # Assert
-        assert result.products == products
-        assert result.total_count == 2
-        self.mock_repository.search.assert_called_once_with(
-            search_text, None, "Electronics", None, 10.0, 100.0, None, 0, 20
-        )
-
-    @pytest.mark.asyncio
-    async def test_list_products(self):
-        """Test listing products with pagination"""
-        # Arrange
-        products = [
-            ProductResponse(id="1", name="Product 1", price=10.0, sku="SKU-1", created_by="user1"),
-            ProductResponse(id="2", name="Product 2", price=20.0, sku="SKU-2", created_by="user2")
-        ]
-        total_count = 2
-        
-        self.mock_repository.list_products.return_value = (products, total_count)
-
-        # Act
-        result = await self.service.list_products(skip=0, limit=10)
-
-        # Assert
-        assert result.products == products
-        assert result.total_count == 2
-        self.mock_repository.list_products.assert_called_once_with(
-            None, None, None, None, None, None, 0, 10
-        )
\ No newline at end of file
+        assert result["products"] == [p.model_dump(mode="json") for p in PRODUCTS]
+        assert result["total_count"] == 2
+        assert result["current_page"] == 1
+        assert result["total_pages"] == 1
+        getattr(self.mock_repository, repo_method).assert_called_once_with(*repo_args)